@@ -4,11 +4,23 @@ Static site generator for resurrexi.io
 Research infrastructure site with experiments, infrastructure specs, and about
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import json
+import os
 import shutil
+import stat
+import subprocess
+import sys
 import yaml
 import markdown
-from jinja2 import Environment, FileSystemLoader
+
+try:
+    # LibYAML C loader: ~10x faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 from datetime import datetime
 
 # Paths
@@ -17,44 +29,195 @@ TEMPLATES_DIR = BASE_DIR / "templates"
 CONTENT_DIR = BASE_DIR / "content"
 STATIC_DIR = BASE_DIR / "static"
 PUBLIC_DIR = BASE_DIR / "public"
+MANIFEST_PATH = BASE_DIR / ".build_manifest.json"
+CURRENT_YEAR = datetime.now().year
+JINJA_CACHE_DIR = BASE_DIR / ".jinja_cache"
 
 # Setup Jinja2
-env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+# One-shot build: templates can't change mid-build, so skip the per-get_template
+# stat() that auto_reload does, and persist compiled bytecode across builds.
+JINJA_CACHE_DIR.mkdir(exist_ok=True)
+env = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    auto_reload=False,
+    cache_size=400,
+    bytecode_cache=FileSystemBytecodeCache(directory=str(JINJA_CACHE_DIR)),
+)
 
 def parse_frontmatter(content):
     """Parse YAML frontmatter from markdown content"""
     if content.startswith('---'):
-        try:
-            _, frontmatter, body = content.split('---', 2)
-            metadata = yaml.safe_load(frontmatter)
-            return metadata, body.strip()
-        except ValueError:
+        # Slice out just the header instead of split()ing the whole document,
+        # so parse cost scales with frontmatter size, not file size
+        end = content.find('\n---', 3)
+        if end == -1:
             return {}, content
+        metadata = yaml.load(content[3:end], Loader=_YamlLoader)
+        return metadata, content[end + 4:].strip()
     return {}, content
 
+def _source_mtime(page):
+    """Latest mtime of a page template and the shared layout it extends"""
+    mtime = (TEMPLATES_DIR / page).stat().st_mtime
+    base = TEMPLATES_DIR / "base.html"
+    if base.exists():
+        mtime = max(mtime, base.stat().st_mtime)
+    return mtime
+
+
+def _render_one(page):
+    """Render and write a single page (thread-safe: Environment rendering is)"""
+    try:
+        out_path = PUBLIC_DIR / page
+        if out_path.exists() and out_path.stat().st_mtime > _source_mtime(page):
+            print(f"Skipped {page} (up to date)")
+            return
+        template = env.get_template(page)
+        # Stream chunks straight to disk instead of materializing the whole
+        # page in memory first; peak memory is O(chunk), not O(page). Stream
+        # into a temp file and os.replace() on success so a render failure
+        # can't leave a truncated page behind (which would also look fresher
+        # than its template and survive the up-to-date skip)
+        tmp_path = out_path.with_suffix(out_path.suffix + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                template.stream(year=CURRENT_YEAR).dump(f)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, out_path)
+        print(f"Built {page}")
+    except Exception as e:
+        print(f"Warning: Could not build {page}: {e}")
+
+
 def build_pages():
     """Build static pages"""
-    pages = [
-        'index.html',
-        'about.html',
-        'infrastructure.html',
-        'experiments.html',
-        'compute.html',  # Keep for when it's ready, just not linked
-    ]
-
-    for page in pages:
+    # Derive the page list from templates/ (one getdents64 call via scandir)
+    # so new pages build without touching this list; base.html and
+    # underscore-prefixed partials are layout-only
+    pages = sorted(
+        e.name for e in os.scandir(TEMPLATES_DIR)
+        if e.is_file() and e.name.endswith('.html')
+        and not e.name.startswith('_') and e.name != 'base.html'
+    )
+
+    # Pages are independent, so render them concurrently; writes overlap
+    # with Jinja2's CPU work
+    with ThreadPoolExecutor(max_workers=min(len(pages), os.cpu_count() or 1)) as ex:
+        list(ex.map(_render_one, pages))
+
+    # Drop outputs for pages removed/renamed since the last build
+    previous = []
+    if MANIFEST_PATH.exists():
+        try:
+            previous = json.loads(MANIFEST_PATH.read_text())
+        except json.JSONDecodeError:
+            previous = []
+    for stale in set(previous) - set(pages):
+        (PUBLIC_DIR / stale).unlink(missing_ok=True)
+        print(f"Removed stale {stale}")
+    MANIFEST_PATH.write_text(json.dumps(pages, indent=2))
+
+def _sendfile_copy(src_path, dst_path, st):
+    """Copy one regular file with os.sendfile (in-kernel, no userspace buffer).
+
+    Preserves mode and timestamps like shutil.copy2, so unchanged assets keep
+    stable mtimes and rsync-based deploys don't re-send the whole tree.
+    """
+    size = st.st_size
+    src_fd = os.open(src_path, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
         try:
-            template = env.get_template(page)
-            output = template.render(year=datetime.now().year)
-            (PUBLIC_DIR / page).write_text(output)
-            print(f"Built {page}")
-        except Exception as e:
-            print(f"Warning: Could not build {page}: {e}")
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    os.chmod(dst_path, stat.S_IMODE(st.st_mode))
+    os.utime(dst_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _prune_stale(src, dst):
+    """Remove entries under dst that no longer exist under src (mirror)."""
+    stack = [(Path(src), Path(dst))]
+    while stack:
+        cur_src, cur_dst = stack.pop()
+        try:
+            names = {e.name for e in os.scandir(cur_src)}
+        except FileNotFoundError:
+            names = set()
+        with os.scandir(cur_dst) as it:
+            for entry in it:
+                if entry.name not in names:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                    print(f"Removed stale {entry.path}")
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append((cur_src / entry.name, Path(entry.path)))
+
+
+def _fast_copytree(src, dst):
+    """Mirror a directory tree with platform-native bulk copy.
+
+    Linux: iterative os.scandir walk + file-to-file os.sendfile, skipping the
+    per-file Python read/write loop shutil uses. Windows: robocopy with
+    multithreaded copy. Anywhere else: plain shutil.copytree. Every path
+    mirrors: destination entries whose source is gone are pruned, so deleted
+    assets can't linger in public/ across incremental builds.
+    """
+    src = Path(src)
+    dst = Path(dst)
+
+    if sys.platform == "win32":
+        # robocopy exit codes < 8 mean success (0 = nothing to do, 1 = copied)
+        result = subprocess.run(
+            ["robocopy", str(src), str(dst), "/MIR", "/MT:16", "/NFL", "/NDL", "/NJH", "/NJS"]
+        )
+        if result.returncode >= 8:
+            raise RuntimeError(f"robocopy failed: {src} -> {dst}")
+        return
+
+    if sys.platform != "linux":
+        # Other POSIX systems expose os.sendfile too, but only for socket
+        # destinations; file-to-file copies raise ENOTSOCK/ENOTSUP there
+        shutil.copytree(src, dst, dirs_exist_ok=True)
+        _prune_stale(src, dst)
+        return
+
+    stack = [(src, dst)]
+    while stack:
+        cur_src, cur_dst = stack.pop()
+        os.makedirs(cur_dst, exist_ok=True)
+        with os.scandir(cur_src) as it:
+            for entry in it:
+                target = cur_dst / entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((Path(entry.path), target))
+                elif entry.is_file(follow_symlinks=False):
+                    _sendfile_copy(entry.path, target, entry.stat())
+                # Symlinks match neither no-follow branch; dereference them
+                # like shutil.copytree does so linked assets still ship
+                elif entry.is_dir():
+                    stack.append((Path(entry.path), target))
+                elif entry.is_file():
+                    _sendfile_copy(entry.path, target, entry.stat())
+
+    _prune_stale(src, dst)
+
 
 def copy_static():
     """Copy static assets"""
     if STATIC_DIR.exists():
-        shutil.copytree(STATIC_DIR, PUBLIC_DIR / "static", dirs_exist_ok=True)
+        _fast_copytree(STATIC_DIR, PUBLIC_DIR / "static")
         print("Copied static assets")
 
 def copy_apps():
@@ -62,7 +225,7 @@ def copy_apps():
     # ASRI Dashboard (generated static HTML from asri scheduler)
     asri_static = BASE_DIR.parent.parent / "resurrexi-projects" / "asri" / "static_site"
     if asri_static.exists() and (asri_static / "index.html").exists():
-        shutil.copytree(asri_static, PUBLIC_DIR / "asri", dirs_exist_ok=True)
+        _fast_copytree(asri_static, PUBLIC_DIR / "asri")
         print("Copied ASRI dashboard")
     else:
         print("Warning: ASRI static site not found, skipping")
@@ -70,17 +233,15 @@ def copy_apps():
     # Research Dashboards (migrated from farzulla.org)
     dashboards_dir = BASE_DIR / "dashboards"
     if dashboards_dir.exists():
-        shutil.copytree(dashboards_dir, PUBLIC_DIR / "dashboards", dirs_exist_ok=True)
+        _fast_copytree(dashboards_dir, PUBLIC_DIR / "dashboards")
         print("Copied research dashboards")
 
 def main():
     """Build the entire site"""
     print("Building resurrexi.io...")
 
-    # Clean and recreate public directory
-    if PUBLIC_DIR.exists():
-        shutil.rmtree(PUBLIC_DIR)
-    PUBLIC_DIR.mkdir()
+    # Incremental: keep existing outputs, pages skip themselves when fresh
+    PUBLIC_DIR.mkdir(exist_ok=True)
 
     # Build all pages
     build_pages()
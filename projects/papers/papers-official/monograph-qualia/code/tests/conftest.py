@@ -49,23 +49,33 @@ def isolated_node_graph():
 
 # --- Numpy array fixtures ---
 
-@pytest.fixture
+# Module-scoped and frozen (writeable=False): the metrics under test only read
+# their inputs, so each array is synthesized once per test module and any
+# accidental in-place mutation raises instead of leaking between tests.
+
+@pytest.fixture(scope="module")
 def stable_activations():
     """Synthetic activations that are stable (low variance across time)."""
     rng = np.random.default_rng(42)
     base = rng.uniform(0.6, 0.8, size=(1, 8))
     noise = rng.normal(0, 0.01, size=(20, 8))
-    return base + noise
+    arr = base + noise
+    arr.setflags(write=False)
+    return arr
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def unstable_activations():
     """Synthetic activations that are unstable (high variance across time)."""
     rng = np.random.default_rng(42)
-    return rng.uniform(0.0, 1.0, size=(20, 8))
+    arr = rng.uniform(0.0, 1.0, size=(20, 8))
+    arr.setflags(write=False)
+    return arr
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def constant_activations():
     """Activations that are perfectly constant over time."""
-    return np.ones((10, 5)) * 0.5
+    arr = np.full((10, 5), 0.5)
+    arr.setflags(write=False)
+    return arr
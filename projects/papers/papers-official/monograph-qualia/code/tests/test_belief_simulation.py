@@ -118,6 +118,7 @@ class TestCreateNetworks:
 # ── Simulation / convergence ─────────────────────────────────────────────────
 
 
+@pytest.mark.simulate
 class TestSimulation:
     def test_simulate_returns_step_count(self, small_complete_graph):
         net = ConsciousnessBeliefNetwork(small_complete_graph)
@@ -15,7 +15,14 @@ from unittest import mock
 
 
 def _import_metrics():
-    """Import metrics module with torch and model mocked out so it loads without torch."""
+    """Import metrics module with torch and model mocked out so it loads without torch.
+
+    The mocked module is cached in sys.modules so the reload (which re-runs
+    the sklearn/scipy imports) happens at most once per interpreter.
+    """
+    cached = sys.modules.get("_metrics_mocked")
+    if cached is not None:
+        return cached
     # Mock torch and model at module level so metrics.py can import
     fake_torch = mock.MagicMock()
     fake_model = mock.MagicMock()
@@ -23,6 +30,7 @@ def _import_metrics():
         # Also need sklearn
         import metrics as m
         importlib.reload(m)  # reload to pick up mocks
+        sys.modules["_metrics_mocked"] = m
         return m
 
 
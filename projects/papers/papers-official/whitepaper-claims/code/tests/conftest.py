@@ -1,4 +1,5 @@
 """Shared fixtures for whitepaper-claims tests."""
+import functools
 import sys
 from pathlib import Path
 
@@ -9,6 +10,30 @@ import pytest
 # Ensure src is importable
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Copy-on-write makes the defensive .copy() calls on session-scoped fixtures
+# lazy (data is only duplicated if the consumer writes). The copies themselves
+# stay: CoW does not protect the shared fixture from a callee that writes a
+# column on the very frame it was handed. Default (and the option deprecated)
+# from pandas 3.0 onward, hence the guard.
+try:
+    pd.set_option("mode.copy_on_write", True)
+except (KeyError, pd.errors.OptionError):
+    pass
+
+
+# Relative cost weights for the expensive tests; anything unlisted is cheap.
+# Scheduling heavy tests first keeps xdist workers from idling on a straggler.
+_COST = {
+    'test_matrix_with_planted_signal': 100,
+    'test_random_matrix_few_signals': 80,
+    'test_sub_results_are_dicts': 50,
+    'test_name_propagated': 50,
+}
+
+
+def pytest_collection_modifyitems(items):
+    items.sort(key=lambda it: -_COST.get(it.name.split('[')[0], 1))
+
 
 @pytest.fixture
 def rng():
@@ -24,6 +49,43 @@ def random_matrix(rng):
     return _make
 
 
+@pytest.fixture(scope="session")
+def mp_bounds():
+    """Memoized marchenko_pastur_bounds.
+
+    The RMT tests hit the same (n, p, sigma) triples repeatedly; caching at
+    session scope evaluates each unique triple once.
+    """
+    from stats.rmt import marchenko_pastur_bounds
+    return functools.lru_cache(maxsize=None)(marchenko_pastur_bounds)
+
+
+@pytest.fixture(scope="session")
+def noise_pool():
+    """Pool of deterministic standard-normal matrices, drawn once per session.
+
+    Keyed by shape; arrays are frozen (writeable=False), so tests that mutate
+    must .copy() first. Drawn as float32 straight into preallocated buffers:
+    half the memory traffic for the downstream eigendecompositions, and the
+    RMT assertions are loose statistical bounds that don't need float64.
+    """
+    rng = np.random.default_rng(0)
+    pool = {}
+    for shape in [(100, 50), (40, 20), (30, 20)]:
+        buf = np.empty(shape, dtype=np.float32)
+        rng.standard_normal(out=buf, dtype=np.float32)
+        buf.setflags(write=False)
+        pool[shape] = buf
+    return pool
+
+
+@pytest.fixture(scope="session")
+def pure_noise_mp_result(noise_pool):
+    """run_mp_test on the canonical 100x50 noise matrix, computed once."""
+    from stats.rmt import test_against_mp
+    return test_against_mp(noise_pool[(100, 50)])
+
+
 @pytest.fixture
 def identity_matrix():
     """Factory fixture: returns an (n, n) identity matrix."""
@@ -32,29 +94,45 @@ def identity_matrix():
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_price_series():
-    """Realistic price series with DatetimeIndex for market tests."""
-    np.random.seed(42)
+    """Realistic price series with DatetimeIndex for market tests.
+
+    Session-scoped: the data is deterministic and consumers copy before
+    mutating, so the GBM synthesis runs once per test session.
+    """
+    rng = np.random.default_rng(42)
     n_days = 252
     dates = pd.date_range("2024-01-01", periods=n_days, freq="D")
     # Geometric Brownian Motion prices
-    log_returns = np.random.normal(0.0003, 0.02, n_days)
+    log_returns = rng.normal(0.0003, 0.02, n_days)
     log_returns[0] = 0
     prices = 100.0 * np.exp(np.cumsum(log_returns))
-    volumes = np.random.lognormal(mean=15, sigma=1, size=n_days)
+    volumes = rng.lognormal(mean=15, sigma=1, size=n_days)
     df = pd.DataFrame({
         "timestamp": dates,
-        "open": prices * (1 + np.random.uniform(-0.005, 0.005, n_days)),
-        "high": prices * (1 + np.abs(np.random.normal(0, 0.01, n_days))),
-        "low": prices * (1 - np.abs(np.random.normal(0, 0.01, n_days))),
+        "open": prices * (1 + rng.uniform(-0.005, 0.005, n_days)),
+        "high": prices * (1 + np.abs(rng.normal(0, 0.01, n_days))),
+        "low": prices * (1 - np.abs(rng.normal(0, 0.01, n_days))),
         "close": prices,
         "volume": volumes,
     })
     return df
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_close_np(sample_price_series):
+    """Close prices from sample_price_series as a read-only ndarray.
+
+    Tests that only need the raw price path can take this instead of
+    re-extracting the column and converting per test.
+    """
+    close = sample_price_series["close"].to_numpy()
+    close.setflags(write=False)
+    return close
+
+
+@pytest.fixture(scope="session")
 def sample_returns_series(sample_price_series):
     """Log returns corresponding to sample_price_series."""
     close = sample_price_series["close"]
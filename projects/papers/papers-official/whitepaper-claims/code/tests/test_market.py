@@ -55,8 +55,8 @@ class TestComputeReturns:
 
     def test_formula_is_log_returns(self, ss):
         """Verify log(p_t / p_{t-1}) formula."""
-        np.random.seed(7)
-        prices = 100 * np.cumprod(1 + np.random.normal(0, 0.02, 50))
+        rng = np.random.default_rng(7)
+        prices = 100 * np.cumprod(1 + rng.normal(0, 0.02, 50))
         df = _make_ohlcv(prices)
         ret = ss.compute_returns(df)
         expected = np.diff(np.log(prices))